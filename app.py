@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import json
-import os
 
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -11,8 +10,11 @@ from utils.data_manager import (
     add_book, book_exists, add_vote, has_voted,
     calculate_scores, export_all_data, import_data
 )
+from utils.covers import get_cover_url, cover_html
+from utils.analytics import compute_stats
+from utils.cache_warmer import start_warm_up, wait_for_warm_up, warm_up_status
 from config.settings import (
-    APP_TITLE, MAX_VOTES_PER_PERSON, TOTAL_POINTS, TOP_BOOKS_TO_DISPLAY
+    APP_TITLE, MAX_VOTES_PER_PERSON, TOTAL_POINTS, TOP_BOOKS_TO_DISPLAY, USER_LIST
 )
 
 # ==================== APP CONFIG ====================
@@ -23,7 +25,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-USER_LIST = ["Gab", "Grace", "Phil", "Silvia", "Kathy", "Val"]
+# Warm data and cover caches in the background while the login screen is shown
+start_warm_up()
 
 # ==================== LOGIN ====================
 if "current_user" not in st.session_state:
@@ -65,6 +68,8 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ==================== DATA LOADING ====================
+wait_for_warm_up()
+
 if 'books' not in st.session_state:
     st.session_state.books = load_books()
 if 'votes' not in st.session_state:
@@ -139,11 +144,10 @@ if page == "Submit Books":
                 is_selected = st.session_state.selected_book.get(book_idx, False)
 
                 with col:
-                    cover_path = f"covers/{book['title'].replace(' ', '_')}.jpg"
-                    has_cover = os.path.exists(cover_path)
+                    cover_url = get_cover_url(book['title'])
 
-                    if has_cover:
-                        st.image(cover_path, use_container_width=True)
+                    if cover_url:
+                        st.markdown(cover_html(cover_url, book['title']), unsafe_allow_html=True)
                     else:
                         st.markdown(f"""
                                 <div style="
@@ -187,10 +191,10 @@ elif page == "View Books":
                 col1, col2 = st.columns([1, 3])
                 
                 with col1:
-                    # Check for cover image in covers folder
-                    cover_path = f"covers/{book['title'].replace(' ', '_')}.jpg"
-                    if os.path.exists(cover_path):
-                        st.image(cover_path, use_container_width=True)
+                    # Cover is served statically under a content-hashed URL
+                    cover_url = get_cover_url(book['title'])
+                    if cover_url:
+                        st.markdown(cover_html(cover_url, book['title']), unsafe_allow_html=True)
                     else:
                         # Placeholder if no cover
                         st.markdown(f"""
@@ -283,9 +287,9 @@ elif page == "Time to Vote!!":
                         
                         with col:
                             # Display cover
-                            cover_path = f"covers/{book['title'].replace(' ', '_')}.jpg"
-                            if os.path.exists(cover_path):
-                                st.image(cover_path, use_column_width=True)
+                            cover_url = get_cover_url(book['title'])
+                            if cover_url:
+                                st.markdown(cover_html(cover_url, book['title']), unsafe_allow_html=True)
                             else:
                                 # Placeholder
                                 st.markdown(f"""
@@ -400,9 +404,10 @@ elif page == "Results":
             cols = st.columns(4)
             for i, book in enumerate(unvoted_books):
                 with cols[i % 4]:
-                    cover_path = f"covers/{book['title'].replace(' ', '_')}.jpg"
-                    if os.path.exists(cover_path):
-                        st.image(cover_path, caption=f"{book['title']} — {book['author']}", use_container_width=True)
+                    cover_url = get_cover_url(book['title'])
+                    if cover_url:
+                        st.markdown(cover_html(cover_url, book['title']), unsafe_allow_html=True)
+                        st.caption(f"{book['title']} — {book['author']}")
                     else:
                         st.markdown(f"""
                             <div style="
@@ -426,9 +431,9 @@ elif page == "Results":
             col1, col2 = st.columns([1, 2])
 
             with col1:
-                cover_path = f"covers/{book['title'].replace(' ', '_')}.jpg"
-                if os.path.exists(cover_path):
-                    st.image(cover_path, use_container_width=True)
+                cover_url = get_cover_url(book['title'])
+                if cover_url:
+                    st.markdown(cover_html(cover_url, book['title']), unsafe_allow_html=True)
                 else:
                     st.markdown(f"""
                         <div style="
@@ -466,33 +471,47 @@ elif page == "Results":
     st.divider()
     st.header("🎉 Fun Stats")
 
-    # 🏅 Top Submitter
-    submitter_totals = {}
-    for book in books:
-        submitter_totals[book["submitter"]] = submitter_totals.get(book["submitter"], 0) + book["total_points"]
+    stats = compute_stats(books, votes)
+    success = stats["submitter_success"]
 
-    top_submitter = max(submitter_totals, key=submitter_totals.get)
-    st.write(f"🏅 **Top Submitter:** {top_submitter} — {submitter_totals[top_submitter]} total points received")
+    # 🏅 Top Submitter
+    top_submitter = stats["top_submitter"]
+    st.write(f"🏅 **Top Submitter:** {top_submitter} — {success.loc[top_submitter, 'points']:.0f} total points received")
 
     # 🤓 Best Voter — voted for most Top 6 books
-    top6_titles = [b["title"] for b in ranked_books[:6]]
-    voter_counts = {}
-
-    for vote_entry in votes:
-        voter = vote_entry["voter"]
-        count_top6 = sum(
-            1 for (book_index, _) in vote_entry["votes"]
-            if books[book_index]["title"] in top6_titles
-        )
-        if count_top6 > 0:
-            voter_counts[voter] = count_top6
-
-    if voter_counts:
-        best_voter = max(voter_counts, key=voter_counts.get)
-        st.write(f"🤓 **Best Voter:** {best_voter} — voted for {voter_counts[best_voter]} of the Top 6 books!")
+    if stats["best_voter"]:
+        st.write(f"🤓 **Best Voter:** {stats['best_voter']} — voted for {stats['best_voter_count']} of the Top 6 books!")
     else:
         st.write("No top-6 votes recorded yet.")
 
+    # 🤝 Most aligned voters
+    if stats["most_aligned"] and stats["most_aligned"][2] > 0:
+        voter_a, voter_b, similarity = stats["most_aligned"]
+        st.write(f"🤝 **Most Aligned Voters:** {voter_a} & {voter_b} — {similarity:.0%} agreement")
+
+    # 🎯 Consensus vs. 🔥 polarizing
+    if not stats["consensus"].empty:
+        consensus = stats["consensus"].iloc[0]
+        st.write(f"🎯 **Consensus Pick:** {consensus['title']} — backed by {consensus['support']:.0%} of voters")
+    if not stats["polarizing"].empty and stats["polarizing"].iloc[0]["spread"] > 0:
+        polarizing = stats["polarizing"].iloc[0]
+        st.write(f"🔥 **Most Polarizing:** {polarizing['title']} — its {polarizing['supporters']} supporters split {polarizing['points']:.0f} points very unevenly")
+    if not stats["niche"].empty:
+        niche_titles = ", ".join(stats["niche"]["title"].head(3))
+        st.write(f"🌱 **Niche Picks:** {niche_titles} — each championed by a single voter")
+
+    with st.expander("📈 More Stats"):
+        st.subheader("Submitter Success")
+        st.dataframe(success.rename(columns={
+            "books": "Books", "points": "Points", "avg_points": "Avg / Book",
+            "top_books": "In Top 6", "share": "Share"
+        }).style.format({"Points": "{:.0f}", "Avg / Book": "{:.1f}", "Share": "{:.0%}"}),
+            use_container_width=True)
+
+        st.subheader("Voter Agreement")
+        st.caption("Cosine similarity of how each pair of voters spread their points")
+        st.dataframe(stats["agreement"].style.format("{:.0%}"), use_container_width=True)
+
     st.divider()
     st.success("🌟 The Top 6 books (highlighted in gold) are the final selections!")                   
 
@@ -510,6 +529,12 @@ with st.sidebar:
     # Admin tools - only for Phil
     if is_admin:
         st.subheader("🔧 Admin Tools")
+
+        warm_report = warm_up_status()
+        if warm_report and 'error' not in warm_report:
+            st.caption(f"⚡ Caches warm: {warm_report['covers']} covers, {warm_report['books']} books in {warm_report['seconds']}s")
+            if warm_report['invalid_covers']:
+                st.caption(f"⚠️ Unusable covers: {', '.join(warm_report['invalid_covers'])}")
         
         # Export
         if st.button("📥 Export Data", use_container_width=True):
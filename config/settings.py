@@ -3,10 +3,27 @@ APP_TITLE = "Book Club Voting System"
 MAX_VOTES_PER_PERSON = 5
 TOTAL_POINTS = 100
 TOP_BOOKS_TO_DISPLAY = 6
+USER_LIST = ["Gab", "Grace", "Phil", "Silvia", "Kathy", "Val"]
 
 # Goodreads scraping settings
 REQUEST_TIMEOUT = 10
 
 # Data file paths
 BOOKS_DATA_PATH = 'data/books.json'
-VOTES_DATA_PATH = 'data/votes.json'
\ No newline at end of file
+VOTES_DATA_PATH = 'data/votes.json'
+
+# GitHub persistence settings
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_BRANCH = 'main'
+GITHUB_SYNC_STATE_PATH = 'data/.github_sync.json'
+
+# Cover images
+COVERS_DIR = 'covers'
+# Served by Streamlit static serving (enableStaticServing) at app/static/covers/
+STATIC_COVERS_DIR = 'static/covers'
+STATIC_COVERS_URL = 'app/static/covers'
+MAX_COVER_BYTES = 5 * 1024 * 1024
+MAX_COVER_DIMENSION = 4000
+
+# Startup warm-up settings
+WARMUP_WORKERS = 8
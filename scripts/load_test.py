@@ -0,0 +1,302 @@
+'''Concurrent-session load test for the Book Club app
+
+Drives many Streamlit AppTest sessions in parallel against a scratch copy of the
+app, scripting the member flows (log in, submit books, vote, poll results), with
+GitHub commits and restores stubbed out. Reports rerun latency percentiles,
+throughput, approximate memory per session, submissions the app rejected and any
+lost updates found in data/books.json / data/votes.json at the end of the run.
+
+The run starts from empty books and votes files (see --keep-books / --keep-votes);
+the shipped books.json already holds each member's five-book cap, which would make
+the app reject every scripted submission.
+
+Only the admin can vote, and the app allows one ballot per voter, so every admin
+session after the first would stop at "already voted" and the votes.json
+lost-update check could never fire. Workers therefore stub has_voted so each admin
+session casts its own ballot (a separate entry, told apart by its timestamp);
+pass --one-ballot to keep the app's real check.
+
+AppTest swaps a process-global Runtime on every run, so concurrent sessions run in
+separate worker processes. Workers share the scratch data files, as sessions on a
+real instance do, and keep their finished sessions open so memory accumulates the
+way it would with that many members connected.
+
+Usage:
+    python scripts/load_test.py --sessions 30 --concurrency 10
+'''
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILES = ['app.py', 'config', 'utils', 'covers', 'data', 'static', '.streamlit']
+
+# Per-worker state, set up by init_worker
+_commits = []
+_open_sessions = []
+_baseline_rss = 0
+
+def prepare_workdir(keep_books=False, keep_votes=False):
+    '''Copy the app into a scratch directory so the run never touches the real data'''
+    workdir = tempfile.mkdtemp(prefix='bookclub-load-')
+    for name in APP_FILES:
+        src = os.path.join(REPO_ROOT, name)
+        if os.path.isdir(src):
+            shutil.copytree(src, os.path.join(workdir, name), ignore=shutil.ignore_patterns('__pycache__'))
+        elif os.path.exists(src):
+            shutil.copy2(src, workdir)
+    for name, keep in (('books.json', keep_books), ('votes.json', keep_votes)):
+        if not keep:
+            with open(os.path.join(workdir, 'data', name), 'w', encoding='utf-8') as f:
+                json.dump([], f)
+    return workdir
+
+def find_button(at, label):
+    '''Return the first button (including form submit buttons) with the given label'''
+    for button in at.button:
+        if button.label == label:
+            return button
+    raise LookupError(f"No button labelled {label!r}")
+
+class Session:
+    '''One simulated member: an AppTest instance plus its timings and acknowledged writes'''
+
+    def __init__(self, session_id, user, app_path, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.session_id = session_id
+        self.user = user
+        self.at = AppTest.from_file(app_path, default_timeout=timeout)
+        self.latencies = []
+        self.errors = []
+        self.books_acked = []
+        self.books_rejected = []
+        self.votes_acked = []
+        self.votes_skipped = []
+
+    def run(self, element=None):
+        '''Rerun the script (optionally via a widget interaction) and time it'''
+        start = time.perf_counter()
+        if element is None:
+            self.at.run()
+        else:
+            element.run()
+        self.latencies.append(time.perf_counter() - start)
+        for exc in self.at.exception:
+            self.errors.append(exc.value)
+
+    def login(self):
+        self.run()
+        self.at.selectbox[0].select(self.user)
+        self.run(find_button(self.at, "Continue").click())
+
+    def submit_books(self, count):
+        for n in range(count):
+            title = f"Load Test {self.session_id}-{n}"
+            self.at.text_input[0].input(title)
+            self.at.text_input[1].input("Load Tester")
+            self.run(find_button(self.at, "📖 Submit Book").click())
+            if any(b['title'] == title for b in self.at.session_state.books):
+                self.books_acked.append(title)
+            else:
+                messages = [m.value for m in list(self.at.warning) + list(self.at.error)]
+                self.books_rejected.append(messages[0] if messages else "no message")
+
+    def vote(self):
+        self.run(self.at.sidebar.radio[0].set_value("Time to Vote!!"))
+        if any("already voted" in w.value for w in self.at.warning):
+            self.votes_skipped.append("already voted")
+            return
+        selects = [s for s in self.at.selectbox if s.key and s.key.startswith("vote_select_")]
+        if len(selects) < 2:
+            self.votes_skipped.append("fewer than 2 books to vote on")
+            return
+        selects[0].set_value(50)
+        selects[1].set_value(50)
+        before = len(self.at.session_state.votes)
+        self.run(find_button(self.at, "🗳️ Submit Vote").click())
+        votes = self.at.session_state.votes
+        if len(votes) > before:
+            self.votes_acked.append(votes[-1]['timestamp'])
+
+    def poll_results(self, polls):
+        self.run(self.at.sidebar.radio[0].set_value("Results"))
+        for _ in range(polls - 1):
+            self.run()
+
+def current_rss_kib():
+    '''Resident memory of this process in KiB (peak RSS where /proc is unavailable)'''
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        # ru_maxrss is KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _fake_commit(file_path, commit_message):
+    _commits.append(file_path)
+    return True
+
+def init_worker(workdir, one_ballot=False):
+    '''Point a worker at the scratch app and stub out GitHub before any session runs'''
+    global _baseline_rss
+    os.chdir(workdir)
+    sys.path.insert(0, workdir)
+
+    # Import everything the app imports, so that cost lands in the baseline
+    import pandas  # noqa: F401
+    import streamlit.testing.v1  # noqa: F401
+    import utils.analytics  # noqa: F401
+    import utils.cache_warmer
+
+    # Patch the module globals the app resolves at call time, so no request leaves the machine
+    mock.patch('utils.data_manager.commit_to_github', _fake_commit).start()
+    mock.patch('utils.cache_warmer.restore_from_github', lambda: []).start()
+    if not one_ballot:
+        # app.py re-imports has_voted on every rerun, so this reaches the vote page
+        mock.patch('utils.data_manager.has_voted', lambda votes, voter_name: False).start()
+
+    # The process-wide cover cache is shared by all sessions, not a per-session cost
+    utils.cache_warmer.start_warm_up()
+    utils.cache_warmer.wait_for_warm_up()
+    _baseline_rss = current_rss_kib()
+
+def run_session(session_id, user, args):
+    '''Script one member's visit; admins also vote and poll the results page'''
+    session = Session(session_id, user, os.path.abspath('app.py'), args.timeout)
+    commits_before = len(_commits)
+    try:
+        session.login()
+        session.submit_books(args.books)
+        if user == args.admin:
+            session.vote()
+            session.poll_results(args.polls)
+    except Exception as e:
+        session.errors.append(f"{type(e).__name__}: {e}")
+    _open_sessions.append(session)
+
+    return {
+        'worker': os.getpid(),
+        'latencies': session.latencies,
+        'errors': [str(e) for e in session.errors],
+        'books_acked': session.books_acked,
+        'books_rejected': session.books_rejected,
+        'votes_acked': session.votes_acked,
+        'votes_skipped': session.votes_skipped,
+        'commits': len(_commits) - commits_before,
+        'rss': current_rss_kib(),
+        'baseline_rss': _baseline_rss,
+        'open_sessions': len(_open_sessions),
+    }
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def find_lost_updates(workdir, sessions):
+    '''Compare every acknowledged write with what ended up on disk'''
+    with open(os.path.join(workdir, 'data', 'books.json'), encoding='utf-8') as f:
+        saved_titles = {b['title'] for b in json.load(f)}
+    with open(os.path.join(workdir, 'data', 'votes.json'), encoding='utf-8') as f:
+        saved_votes = {v['timestamp'] for v in json.load(f)}
+
+    lost_books = [t for s in sessions for t in s['books_acked'] if t not in saved_titles]
+    lost_votes = [t for s in sessions for t in s['votes_acked'] if t not in saved_votes]
+    return lost_books, lost_votes
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive concurrent AppTest sessions against the app")
+    parser.add_argument('--sessions', type=int, default=20, help="total simulated members")
+    parser.add_argument('--concurrency', type=int, default=4, help="worker processes running sessions at once")
+    parser.add_argument('--books', type=int, default=2, help="books submitted per session")
+    parser.add_argument('--polls', type=int, default=3, help="results page reruns per admin session")
+    parser.add_argument('--admin', default="Phil", help="user that votes and polls results")
+    parser.add_argument('--timeout', type=float, default=30, help="per-rerun timeout in seconds")
+    parser.add_argument('--keep-books', action='store_true', help="start from the current books.json")
+    parser.add_argument('--keep-votes', action='store_true', help="start from the current votes.json")
+    parser.add_argument('--one-ballot', action='store_true',
+                        help="keep the app's one-ballot-per-voter check (admin sessions after the first can't vote)")
+    args = parser.parse_args()
+
+    workdir = prepare_workdir(args.keep_books, args.keep_votes)
+    sys.path.insert(0, workdir)
+    from config.settings import USER_LIST
+
+    # AppTest replaces __main__ while a script runs, so hand workers importable references
+    import load_test
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.concurrency, initializer=load_test.init_worker,
+                             initargs=(workdir, args.one_ballot)) as pool:
+        futures = [
+            pool.submit(load_test.run_session, i, USER_LIST[i % len(USER_LIST)], args)
+            for i in range(args.sessions)
+        ]
+        sessions = [f.result() for f in futures]
+    elapsed = time.perf_counter() - start
+
+    latencies = [l for s in sessions for l in s['latencies']]
+    errors = [e for s in sessions for e in s['errors']]
+    commits = sum(s['commits'] for s in sessions)
+    lost_books, lost_votes = find_lost_updates(workdir, sessions)
+    acked_books = sum(len(s['books_acked']) for s in sessions)
+    acked_votes = sum(len(s['votes_acked']) for s in sessions)
+    rejections, vote_skips = {}, {}
+    for s in sessions:
+        for reason in s['books_rejected']:
+            rejections[reason] = rejections.get(reason, 0) + 1
+        for reason in s['votes_skipped']:
+            vote_skips[reason] = vote_skips.get(reason, 0) + 1
+
+    # Measure growth from each worker's first session on: lazy imports and one-off
+    # caches on the first rerun would otherwise be billed to the first session
+    per_worker = {}
+    for s in sessions:
+        per_worker.setdefault(s['worker'], []).append(s)
+    growth, measured = 0, 0
+    for reports in per_worker.values():
+        reports.sort(key=lambda r: r['open_sessions'])
+        first, last = reports[0], reports[-1]
+        if len(reports) > 1:
+            growth += last['rss'] - first['rss']
+            measured += len(reports) - 1
+        else:
+            growth += first['rss'] - first['baseline_rss']
+            measured += 1
+    rss_per_session = growth / max(1, measured)
+
+    print(f"📊 Load test: {args.sessions} sessions, concurrency {args.concurrency}, workdir {workdir}")
+    print(f"  Reruns:        {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f} reruns/s)")
+    if latencies:
+        print(f"  Latency (ms):  p50 {percentile(latencies, 50) * 1000:.0f}  "
+              f"p90 {percentile(latencies, 90) * 1000:.0f}  "
+              f"p99 {percentile(latencies, 99) * 1000:.0f}  "
+              f"max {max(latencies) * 1000:.0f}  "
+              f"mean {statistics.mean(latencies) * 1000:.0f}")
+    print(f"  Memory:        ~{rss_per_session:.0f} KiB RSS growth per open session (after the first in each worker)")
+    print(f"  GitHub stub:   {commits} commits intercepted")
+    print(f"  Books:         {acked_books} acknowledged, {sum(rejections.values())} rejected, {len(lost_books)} lost")
+    for reason, count in sorted(rejections.items(), key=lambda r: -r[1]):
+        print(f"    {count} × {reason}")
+    print(f"  Votes:         {acked_votes} acknowledged, {sum(vote_skips.values())} skipped, {len(lost_votes)} lost")
+    for reason, count in sorted(vote_skips.items(), key=lambda r: -r[1]):
+        print(f"    {count} × {reason}")
+    if lost_books:
+        print(f"  ⚠️ Lost books: {', '.join(lost_books[:10])}{' ...' if len(lost_books) > 10 else ''}")
+    if errors:
+        print(f"  ❌ {len(errors)} errors, first: {errors[0]}")
+
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import pytest
+
+from utils.analytics import compute_stats
+
+
+def legacy_fun_stats(books, votes):
+    '''The Results page's original loop implementation, kept as the reference'''
+    books = [dict(b) for b in books]
+    book_scores = {book["title"]: 0 for book in books}
+    for vote_entry in votes:
+        for book_index, points in vote_entry["votes"]:
+            if 0 <= book_index < len(books):
+                book_scores[books[book_index]["title"]] += points
+    for book in books:
+        book["total_points"] = book_scores.get(book["title"], 0)
+
+    ranked_books = sorted([b for b in books if b["total_points"] > 0],
+                          key=lambda b: b["total_points"], reverse=True)
+
+    submitter_totals = {}
+    for book in books:
+        submitter_totals[book["submitter"]] = submitter_totals.get(book["submitter"], 0) + book["total_points"]
+    top_submitter = max(submitter_totals, key=submitter_totals.get)
+
+    top6_titles = [b["title"] for b in ranked_books[:6]]
+    voter_counts = {}
+    for vote_entry in votes:
+        count_top6 = sum(
+            1 for (book_index, _) in vote_entry["votes"]
+            if 0 <= book_index < len(books) and books[book_index]["title"] in top6_titles
+        )
+        if count_top6 > 0:
+            voter_counts[vote_entry["voter"]] = count_top6
+    best_voter = max(voter_counts, key=voter_counts.get) if voter_counts else None
+
+    return top_submitter, best_voter, voter_counts.get(best_voter, 0)
+
+
+def make_books(*submitters):
+    return [{'title': f"Book {i}", 'submitter': s} for i, s in enumerate(submitters)]
+
+
+@pytest.fixture
+def tied_club():
+    # Gab and Grace tie on 90 points; books 3, 4 and 6 tie on 20 points across the
+    # top-6 boundary; Val and Silvia tie on voting for 4 of the top 6 books
+    books = make_books('Gab', 'Grace', 'Gab', 'Grace', 'Phil', 'Phil', 'Val', 'Kathy')
+    votes = [
+        {'voter': 'Kathy', 'votes': [[0, 30], [1, 40], [5, 10], [6, 20]]},
+        {'voter': 'Val', 'votes': [[2, 30], [3, 20], [4, 20], [7, 30]]},
+        {'voter': 'Silvia', 'votes': [[0, 20], [1, 30], [2, 10], [7, 40]]},
+    ]
+    return books, votes
+
+
+def test_existing_stats_match_legacy_loops(tied_club):
+    books, votes = tied_club
+    stats = compute_stats(books, votes)
+
+    top_submitter, best_voter, best_count = legacy_fun_stats(books, votes)
+    assert (top_submitter, best_voter, best_count) == ('Gab', 'Val', 4)
+    assert stats['top_submitter'] == top_submitter
+    assert stats['best_voter'] == best_voter
+    assert stats['best_voter_count'] == best_count
+
+
+@pytest.mark.parametrize('votes', [
+    [{'voter': 'A', 'votes': [[0, 50], [1, 50]]}, {'voter': 'B', 'votes': [[1, 50], [0, 50]]}],
+    [{'voter': 'A', 'votes': [[2, 100]]}, {'voter': 'B', 'votes': [[3, 100]]}],
+    [{'voter': 'A', 'votes': [[0, 10], [1, 10], [2, 10], [3, 10], [4, 10], [5, 10], [6, 40]]}],
+])
+def test_ties_match_legacy_loops(votes):
+    books = make_books('Gab', 'Grace', 'Val', 'Kathy', 'Gab', 'Grace', 'Val')
+    stats = compute_stats(books, votes)
+
+    assert (stats['top_submitter'], stats['best_voter'], stats['best_voter_count']) == legacy_fun_stats(books, votes)
+
+
+def test_single_supporter_book_is_niche_not_polarizing():
+    books = make_books('Gab', 'Grace', 'Val')
+    votes = [
+        {'voter': 'A', 'votes': [[0, 70], [2, 5], [1, 25]]},
+        {'voter': 'B', 'votes': [[0, 50], [1, 50]]},
+        {'voter': 'C', 'votes': [[0, 1], [1, 99]]},
+        {'voter': 'D', 'votes': [[1, 100]]},
+    ]
+    stats = compute_stats(books, votes)
+
+    assert 'Book 2' in list(stats['niche']['title'])
+    assert 'Book 2' not in list(stats['polarizing']['title'])
+    assert stats['polarizing'].iloc[0]['title'] == 'Book 0'
+
+
+def test_out_of_range_indices_are_ignored():
+    books = make_books('Gab', 'Grace')
+    votes = [{'voter': 'A', 'votes': [[0, 40], [2, 30], [-1, 30]]}]
+    stats = compute_stats(books, votes)
+
+    success = stats['submitter_success']
+    assert success.loc['Gab', 'points'] == 40
+    assert success.loc['Grace', 'points'] == 0
+    assert success['points'].sum() == 40
+    assert list(stats['consensus']['title']) == ['Book 0']
+
+
+def test_most_aligned_picks_closest_pair():
+    books = make_books('Gab', 'Grace', 'Val', 'Kathy')
+    votes = [
+        {'voter': 'A', 'votes': [[0, 60], [1, 40]]},
+        {'voter': 'B', 'votes': [[2, 50], [3, 50]]},
+        {'voter': 'C', 'votes': [[0, 55], [1, 45]]},
+    ]
+    voter_a, voter_b, similarity = compute_stats(books, votes)['most_aligned']
+
+    assert {voter_a, voter_b} == {'A', 'C'}
+    assert similarity == pytest.approx((60 * 55 + 40 * 45) / ((60 ** 2 + 40 ** 2) ** 0.5 * (55 ** 2 + 45 ** 2) ** 0.5))
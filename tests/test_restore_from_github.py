@@ -0,0 +1,174 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import data_manager
+
+BOOKS = 'data/books.json'
+VOTES = 'data/votes.json'
+
+
+def blob_sha(content):
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class FakeGitHub:
+    '''Minimal stand-in for the trees and blobs endpoints of the GitHub API'''
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.requests = []
+
+    def set_file(self, path, content):
+        self.files[path] = content
+
+    @property
+    def etag(self):
+        shas = ''.join(f"{p}:{blob_sha(c)}" for p, c in sorted(self.files.items()))
+        return f'"{hashlib.sha1(shas.encode()).hexdigest()}"'
+
+    def handler(self):
+        github = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _json(self, status, body, headers=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                github.requests.append(self.path)
+                if '/git/trees/' in self.path:
+                    if self.headers.get('If-None-Match') == github.etag:
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    tree = [{'path': p, 'type': 'blob', 'sha': blob_sha(c)} for p, c in github.files.items()]
+                    self._json(200, {'tree': tree}, {'ETag': github.etag})
+                elif '/git/blobs/' in self.path:
+                    sha = self.path.rsplit('/', 1)[1]
+                    for content in github.files.values():
+                        if blob_sha(content) == sha:
+                            self._json(200, {'content': base64.b64encode(content).decode(), 'encoding': 'base64'})
+                            return
+                    self._json(404, {'message': 'Not Found'})
+                else:
+                    self._json(404, {'message': 'Not Found'})
+
+        return Handler
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    fake = FakeGitHub({BOOKS: b'[{"title": "Remote"}]', VOTES: b'[]'})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), fake.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_manager, 'GITHUB_API_URL', f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(data_manager.st, 'secrets', {'github': {'token': 't', 'username': 'u', 'repo': 'r'}})
+    monkeypatch.setattr(data_manager, '_checkout_blob_sha', lambda path: None)
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def blob_requests(github):
+    return [r for r in github.requests if '/git/blobs/' in r]
+
+
+def test_first_restore_fetches_missing_files(github):
+    restored = data_manager.restore_from_github()
+
+    assert sorted(restored) == [BOOKS, VOTES]
+    assert read(BOOKS) == github.files[BOOKS]
+    assert read(VOTES) == github.files[VOTES]
+
+
+def test_second_restore_is_a_304(github):
+    data_manager.restore_from_github()
+    github.requests.clear()
+
+    assert data_manager.restore_from_github() == []
+    assert len(github.requests) == 1
+    assert blob_requests(github) == []
+
+
+def test_only_stale_blobs_are_fetched(github):
+    data_manager.restore_from_github()
+    github.set_file(BOOKS, b'[{"title": "Newer"}]')
+    github.requests.clear()
+
+    assert data_manager.restore_from_github() == [BOOKS]
+    assert read(BOOKS) == b'[{"title": "Newer"}]'
+    assert blob_requests(github) == [f"/repos/u/r/git/blobs/{blob_sha(github.files[BOOKS])}"]
+
+
+def test_unpushed_local_edit_is_kept(github, capsys):
+    data_manager.restore_from_github()
+    write(BOOKS, b'[{"title": "Local, not pushed"}]')
+
+    assert data_manager.restore_from_github() == []
+    assert read(BOOKS) == b'[{"title": "Local, not pushed"}]'
+    out = capsys.readouterr().out
+    assert "not yet pushed" in out
+    assert "Conflict" not in out
+
+
+def test_conflicting_edits_keep_local_file(github, capsys):
+    data_manager.restore_from_github()
+    write(BOOKS, b'[{"title": "Local, not pushed"}]')
+    github.set_file(BOOKS, b'[{"title": "Newer"}]')
+
+    assert data_manager.restore_from_github() == []
+    assert read(BOOKS) == b'[{"title": "Local, not pushed"}]'
+    assert "Conflict on data/books.json" in capsys.readouterr().out
+
+
+def test_missing_secrets_file_skips_quietly(github, monkeypatch, capsys):
+    class NoSecretsFile:
+        def __contains__(self, key):
+            raise FileNotFoundError("No secrets found")
+
+    monkeypatch.setattr(data_manager.st, 'secrets', NoSecretsFile())
+
+    assert data_manager.restore_from_github() == []
+    out = capsys.readouterr().out
+    assert "GitHub secrets not configured" in out
+    assert "Error restoring" not in out
+    assert github.requests == []
+
+
+def test_cold_restart_replaces_clean_checkout_copy(github, monkeypatch):
+    # No sync state, as after a hosted restart: the checkout's committed copy is the baseline
+    os.makedirs('data')
+    write(BOOKS, b'[]')
+    write(VOTES, b'[]')
+    monkeypatch.setattr(data_manager, '_checkout_blob_sha', lambda path: blob_sha(b'[]'))
+
+    assert data_manager.restore_from_github() == [BOOKS]
+    assert read(BOOKS) == github.files[BOOKS]
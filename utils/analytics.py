@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config.settings import TOP_BOOKS_TO_DISPLAY
+
+def points_matrix(book_info, vote_info):
+    '''Build a voter × book points matrix (rows: voters in voting order, columns: book index)'''
+    voter_codes, voters = pd.factorize(pd.Series([voter for voter, _ in vote_info], dtype=object))
+    rows, cols, points = [], [], []
+    for code, (_, ballot) in zip(voter_codes, vote_info):
+        for book_index, pts in ballot:
+            if 0 <= book_index < len(book_info):
+                rows.append(code)
+                cols.append(book_index)
+                points.append(pts)
+
+    values = np.zeros((len(voters), len(book_info)))
+    np.add.at(values, (np.array(rows, dtype=int), np.array(cols, dtype=int)), points)
+    return pd.DataFrame(values, index=pd.Index(voters, name='voter'), columns=range(len(book_info)))
+
+def agreement_matrix(matrix):
+    '''Cosine similarity between every pair of voters' point allocations'''
+    values = matrix.to_numpy()
+    norms = np.linalg.norm(values, axis=1)
+    norms[norms == 0] = 1.0
+    unit = values / norms[:, None]
+    return pd.DataFrame(unit @ unit.T, index=matrix.index, columns=matrix.index)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _compute_stats(book_info, vote_info):
+    matrix = points_matrix(book_info, vote_info)
+    titles = pd.Series([title for title, _ in book_info])
+    submitters = pd.Series([submitter for _, submitter in book_info])
+    totals = pd.Series(matrix.sum(axis=0).to_numpy(), index=matrix.columns)
+
+    # Ranking matches the Results page: voted books by points, ties in submission order
+    ranked = totals[totals > 0].sort_values(ascending=False, kind='stable')
+    top_books = ranked.index[:TOP_BOOKS_TO_DISPLAY]
+
+    success = pd.DataFrame({
+        'submitter': submitters,
+        'points': totals.to_numpy(),
+        'in_top': totals.index.isin(top_books),
+    }).groupby('submitter', sort=False).agg(
+        books=('points', 'size'),
+        points=('points', 'sum'),
+        avg_points=('points', 'mean'),
+        top_books=('in_top', 'sum'),
+    )
+    success['share'] = success['points'] / max(totals.sum(), 1)
+
+    top_votes = (matrix[top_books] > 0).sum(axis=1)
+    top_votes = top_votes[top_votes > 0]
+
+    agreement = agreement_matrix(matrix)
+    pair = None
+    if len(agreement) > 1:
+        upper = agreement.where(np.triu(np.ones(agreement.shape, dtype=bool), k=1))
+        best = upper.stack()
+        if not best.empty:
+            a, b = best.idxmax()
+            pair = (a, b, float(best.max()))
+
+    # Consensus: backed by the most voters. Polarizing: the voters who scored it
+    # disagree most on how much (spread of their non-zero points). A book with a
+    # single supporter has nobody to disagree with, so it counts as niche instead.
+    voted = matrix.loc[:, totals > 0]
+    scored = voted.where(voted > 0)
+    book_stats = pd.DataFrame({
+        'title': titles[voted.columns].to_numpy(),
+        'points': totals[voted.columns].to_numpy(),
+        'supporters': scored.count(axis=0).to_numpy(),
+        'support': (voted > 0).mean(axis=0).to_numpy(),
+        'spread': (scored.std(axis=0, ddof=0) / scored.mean(axis=0)).to_numpy(),
+    }, index=voted.columns)
+    consensus = book_stats.sort_values(['support', 'points'], ascending=False, kind='stable')
+    contested = book_stats[book_stats['supporters'] >= 2]
+    polarizing = contested.sort_values(['spread', 'points'], ascending=False, kind='stable')
+    niche = book_stats[book_stats['supporters'] == 1].sort_values('points', ascending=False, kind='stable')
+
+    return {
+        'submitter_success': success,
+        'top_submitter': success['points'].idxmax() if not success.empty else None,
+        'best_voter': top_votes.idxmax() if not top_votes.empty else None,
+        'best_voter_count': int(top_votes.max()) if not top_votes.empty else 0,
+        'agreement': agreement,
+        'most_aligned': pair,
+        'consensus': consensus,
+        'polarizing': polarizing,
+        'niche': niche,
+    }
+
+def compute_stats(books, votes):
+    '''Compute the Fun Stats for the Results page, cached per version of the books and votes'''
+    # Only the fields the stats depend on form the cache key
+    book_info = tuple((b['title'], b['submitter']) for b in books)
+    vote_info = tuple((v['voter'], tuple(tuple(pair) for pair in v['votes'])) for v in votes)
+    return _compute_stats(book_info, vote_info)
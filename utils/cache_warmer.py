@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import WARMUP_WORKERS
+from utils.covers import list_cover_paths, load_cover
+from utils.data_manager import load_books, load_votes, restore_from_github
+
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_warmup_report = None
+
+def warm_up():
+    '''Read the data files and load every cover in a thread pool; return a readiness report
+
+    Reading the data files here only primes the OS page cache; each session still
+    parses its own copy, which is cheaper than copying a shared cached parse.
+    '''
+    start = time.perf_counter()
+    paths = list_cover_paths()
+
+    with ThreadPoolExecutor(max_workers=WARMUP_WORKERS) as pool:
+        cover_futures = [pool.submit(load_cover, path) for path in paths]
+
+        # Pull the latest data committed to GitHub before anything parses the local copies
+        restored = restore_from_github()
+        books_future = pool.submit(load_books)
+        votes_future = pool.submit(load_votes)
+
+        covers = [future.result() for future in cover_futures]
+        books = books_future.result()
+        votes = votes_future.result()
+
+    report = {
+        'restored': restored,
+        'books': len(books),
+        'votes': len(votes),
+        'covers': sum(1 for c in covers if c and c['url']),
+        'invalid_covers': [p for p, c in zip(paths, covers) if not (c and c['url'])],
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+    print(f"🔥 Caches warm: {report['books']} books, {report['votes']} votes, "
+          f"{report['covers']} covers in {report['seconds']}s")
+    return report
+
+def _run_warm_up():
+    global _warmup_report
+    try:
+        _warmup_report = warm_up()
+    except Exception as e:
+        print(f"❌ Cache warm-up failed: {e}")
+        _warmup_report = {'error': str(e)}
+
+def start_warm_up():
+    '''Start the warm-up once per process in the background; later calls are no-ops'''
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_run_warm_up, name="cache-warmup", daemon=True)
+            _warmup_thread.start()
+
+def wait_for_warm_up(timeout=None):
+    '''Block until the warm-up has finished (or timeout) and return its report'''
+    if _warmup_thread is not None:
+        _warmup_thread.join(timeout)
+    return _warmup_report
+
+def warm_up_status():
+    '''Return the warm-up report, or None while it is still running'''
+    return _warmup_report
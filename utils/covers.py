@@ -0,0 +1,123 @@
+import hashlib
+import html
+import io
+import os
+import re
+import shutil
+import threading
+from urllib.parse import quote
+from PIL import Image
+
+from config.settings import (
+    COVERS_DIR, MAX_COVER_BYTES, MAX_COVER_DIMENSION, STATIC_COVERS_DIR, STATIC_COVERS_URL
+)
+
+# path -> {'mtime_ns', 'url', 'width', 'height'}; shared by every session in the process.
+# Unusable covers are cached too (url None) so they are only decoded once per change.
+_cover_cache = {}
+_cover_lock = threading.Lock()
+
+# Published names are <stem>.<12 hex digits>.jpg
+_HASHED_NAME = re.compile(r'^(?P<stem>.+)\.[0-9a-f]{12}\.jpg$')
+
+def cover_path(title):
+    '''Return the expected cover image path for a book title'''
+    return f"{COVERS_DIR}/{title.replace(' ', '_')}.jpg"
+
+def _read_cover(path):
+    '''Read, decode and size-check a cover image; raise ValueError if it is unusable'''
+    size = os.path.getsize(path)
+    if size > MAX_COVER_BYTES:
+        raise ValueError(f"{size} bytes exceeds {MAX_COVER_BYTES}")
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        width, height = img.size
+
+    if not width or not height or max(width, height) > MAX_COVER_DIMENSION:
+        raise ValueError(f"unexpected dimensions {width}x{height}")
+
+    return data, width, height
+
+def _publish_cover(path, data):
+    '''Expose a cover under a content-hashed name in the static folder; return its URL
+
+    The hash changes whenever the image does, so a browser may keep a cached copy
+    for as long as it likes. Up to Streamlit 1.56 the static handler serves ?v= URLs
+    with a ten-year max-age; later releases send no Cache-Control, so browsers fall
+    back to heuristic caching from Last-Modified, which hard links and copy2 keep
+    at the cover's own mtime.
+    '''
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = f"{stem}.{digest}.jpg"
+    target = os.path.join(STATIC_COVERS_DIR, name)
+
+    os.makedirs(STATIC_COVERS_DIR, exist_ok=True)
+    if not os.path.exists(target):
+        tmp_target = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.link(path, tmp_target)
+        except OSError:
+            shutil.copy2(path, tmp_target)
+        os.replace(tmp_target, target)
+
+    # Drop copies of earlier versions of this cover
+    for other in os.listdir(STATIC_COVERS_DIR):
+        match = _HASHED_NAME.match(other)
+        if other != name and match and match.group('stem') == stem:
+            try:
+                os.remove(os.path.join(STATIC_COVERS_DIR, other))
+            except OSError:
+                pass
+
+    return f"{STATIC_COVERS_URL}/{quote(name)}?v={digest}"
+
+def load_cover(path):
+    '''Return the cached cover entry for a path, (re)loading it if the file changed
+
+    Returns None if the file does not exist; an unusable cover gets an entry whose
+    url is None.
+    '''
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    entry = _cover_cache.get(path)
+    if entry is not None and entry['mtime_ns'] == mtime_ns:
+        return entry
+
+    try:
+        data, width, height = _read_cover(path)
+        url = _publish_cover(path, data)
+    except Exception as e:
+        print(f"⚠️ Skipping cover {path}: {e}")
+        url, width, height = None, None, None
+
+    entry = {'mtime_ns': mtime_ns, 'url': url, 'width': width, 'height': height}
+    with _cover_lock:
+        _cover_cache[path] = entry
+    return entry
+
+def get_cover_url(title):
+    '''Return the static URL of a book's cover, or None if there is no usable cover'''
+    entry = load_cover(cover_path(title))
+    return entry['url'] if entry else None
+
+def cover_html(url, title):
+    '''Return an <img> tag for a cover URL, sized to fill its column'''
+    return (f'<img src="{url}" alt="{html.escape(title)}" loading="lazy" '
+            f'style="width: 100%; height: auto; margin-bottom: 0.5rem;">')
+
+def list_cover_paths():
+    '''List every cover image file in the covers directory'''
+    if not os.path.isdir(COVERS_DIR):
+        return []
+    return [
+        f"{COVERS_DIR}/{name}" for name in sorted(os.listdir(COVERS_DIR))
+        if name.lower().endswith('.jpg')
+    ]
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 from datetime import datetime
@@ -5,6 +6,11 @@ import streamlit as st
 import requests
 import base64
 
+from config.settings import (
+    BOOKS_DATA_PATH, VOTES_DATA_PATH, GITHUB_API_URL, GITHUB_BRANCH,
+    GITHUB_SYNC_STATE_PATH, REQUEST_TIMEOUT
+)
+
 def ensure_data_directory():
     '''Create data directory if it doesn't exist'''
     if not os.path.exists('data'):
@@ -30,7 +36,7 @@ def commit_to_github(file_path, commit_message):
             content = f.read()
         
         # GitHub API endpoint
-        api_url = f"https://api.github.com/repos/{username}/{repo}/contents/{file_path}"
+        api_url = f"{GITHUB_API_URL}/repos/{username}/{repo}/contents/{file_path}"
         
         # Get the current file SHA (required for updates)
         headers = {
@@ -59,7 +65,7 @@ def commit_to_github(file_path, commit_message):
         data = {
             "message": commit_message,
             "content": content_base64,
-            "branch": "main"
+            "branch": GITHUB_BRANCH
         }
         
         if sha:
@@ -87,6 +93,133 @@ def commit_to_github(file_path, commit_message):
         st.error(f"Error saving to GitHub: {str(e)}")
         return False
 
+def _git_blob_sha(filepath):
+    '''Compute the git blob SHA of a local file, as reported by the GitHub trees API'''
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+def _load_sync_state():
+    '''Load the ETag and blob SHAs recorded by the last restore'''
+    try:
+        with open(GITHUB_SYNC_STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_sync_state(state):
+    '''Record the ETag and blob SHAs of the last restore'''
+    with open(GITHUB_SYNC_STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def _checkout_blob_sha(path):
+    '''Return the blob SHA of a file as committed in the local checkout, or None'''
+    try:
+        from git import Repo
+        return Repo(os.getcwd()).head.commit.tree[path].hexsha
+    except Exception:
+        return None
+
+def restore_from_github(paths=(BOOKS_DATA_PATH, VOTES_DATA_PATH)):
+    '''Refresh local data files from the GitHub repo when they are missing or stale
+
+    A single conditional request for the branch tree tells us the current blob SHA of
+    every data file; a repo unchanged since the last restore answers 304. A local file
+    is only replaced if it is missing or still matches the last known clean SHA (the
+    one recorded at the last restore, else the one in the local checkout), so edits
+    that never reached GitHub are kept. Returns the list of restored paths.
+    '''
+    try:
+        # Without a secrets.toml, Streamlit raises instead of reporting a missing key
+        # (StreamlitSecretNotFoundError subclasses FileNotFoundError)
+        try:
+            configured = "github" in st.secrets
+        except FileNotFoundError:
+            configured = False
+        if not configured:
+            print("GitHub secrets not configured - skipping restore")
+            return []
+
+        token = st.secrets["github"]["token"]
+        username = st.secrets["github"]["username"]
+        repo = st.secrets["github"]["repo"]
+
+        ensure_data_directory()
+        headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+
+        # Only revalidate if every local file is still what we restored last time
+        state = _load_sync_state()
+        known_shas = state.get('shas', {})
+        local_shas = {p: _git_blob_sha(p) for p in paths if os.path.exists(p)}
+        if state.get('etag') and all(local_shas.get(p) == known_shas.get(p) for p in paths):
+            headers["If-None-Match"] = state['etag']
+
+        tree_url = f"{GITHUB_API_URL}/repos/{username}/{repo}/git/trees/{GITHUB_BRANCH}?recursive=1"
+        print(f"📡 Checking {username}/{repo}@{GITHUB_BRANCH} for newer data...")
+        response = requests.get(tree_url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code == 304:
+            print("✓ Remote data unchanged")
+            return []
+        if response.status_code != 200:
+            print(f"❌ Unexpected response getting tree: {response.status_code}")
+            return []
+
+        remote_shas = {
+            item['path']: item['sha'] for item in response.json().get('tree', [])
+            if item.get('type') == 'blob'
+        }
+
+        restored = []
+        for path in paths:
+            sha = remote_shas.get(path)
+            local_sha = local_shas.get(path)
+            if not sha or local_sha == sha:
+                continue
+
+            if local_sha is not None:
+                clean_sha = known_shas.get(path) or _checkout_blob_sha(path)
+                if local_sha != clean_sha:
+                    # The local file has changes that were never pushed; don't clobber them
+                    if clean_sha is None:
+                        print(f"⚠️ {path} differs from GitHub and no clean copy is known, keeping local file")
+                    elif sha != clean_sha:
+                        print(f"⚠️ Conflict on {path}: local and GitHub copies both changed, keeping local file")
+                    else:
+                        print(f"⚠️ {path} has local edits not yet pushed to GitHub, keeping local file")
+                    continue
+
+            blob_url = f"{GITHUB_API_URL}/repos/{username}/{repo}/git/blobs/{sha}"
+            blob = requests.get(blob_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if blob.status_code != 200:
+                print(f"❌ Failed to fetch {path}: {blob.status_code}")
+                continue
+
+            content = base64.b64decode(blob.json()['content'])
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            local_shas[path] = sha
+            restored.append(path)
+            print(f"⬇️ Restored {path} from GitHub ({sha[:8]})")
+
+        # Record clean SHAs only for files in sync; keep the old baseline for the rest
+        synced = {p: local_shas[p] for p in paths if p in local_shas and local_shas[p] == remote_shas.get(p)}
+        new_state = {'shas': {**known_shas, **synced}}
+        etag = response.headers.get('ETag')
+        if etag and len(synced) == len(paths):
+            new_state['etag'] = etag
+        _save_sync_state(new_state)
+        return restored
+
+    except Exception as e:
+        print(f"❌ Error restoring from GitHub: {e}")
+        return []
+
 def load_books(filepath='data/books.json'):
     '''Load books from JSON file'''
     ensure_data_directory()